@@ -2,6 +2,7 @@
 Monitor commands for Odoo Manager CLI.
 """
 
+import bisect
 from pathlib import Path
 
 import click
@@ -16,6 +17,33 @@ from odoo_manager.core.monitor import (
 from odoo_manager.core.instance import InstanceManager
 from odoo_manager.utils.output import console, success, error, info, warn
 
+# (warning, critical) thresholds used to colour monitor top values
+_CPU_BOUNDS = (70.0, 90.0)
+_MEMORY_BOUNDS = (70.0, 85.0)
+_DISK_BOUNDS = (80.0, 90.0)
+_VALUE_STYLES = ("", "yellow", "red")
+
+_RULE = "=" * 50
+
+_STATUS_COLORS = {
+    HealthStatus.HEALTHY: "green",
+    HealthStatus.WARNING: "yellow",
+    HealthStatus.CRITICAL: "red",
+    HealthStatus.UNKNOWN: "dim",
+}
+
+# Pre-rendered status cells for the per-row tables
+_STATUS_LABELS = {
+    status: f"[{color}]{status}[/{color}]" for status, color in _STATUS_COLORS.items()
+}
+
+_STATUS_SYMBOLS = {
+    HealthStatus.HEALTHY: "✓",
+    HealthStatus.WARNING: "⚠",
+    HealthStatus.CRITICAL: "✗",
+    HealthStatus.UNKNOWN: "?",
+}
+
 
 @click.group(name="monitor")
 def monitor_cli():
@@ -36,8 +64,7 @@ def monitor_status(ctx, instance, verbose):
         monitor = HealthMonitor()
 
         if instance:
-            manager = InstanceManager()
-            inst = manager.get_instance(instance)
+            inst = monitor.manager.get_instance(instance)
             health = monitor.check_instance(inst)
             _print_health_summary(health, verbose)
         else:
@@ -59,8 +86,7 @@ def monitor_check(ctx, instance):
     """
     try:
         monitor = HealthMonitor()
-        manager = InstanceManager()
-        inst = manager.get_instance(instance)
+        inst = monitor.manager.get_instance(instance)
         health = monitor.check_instance(inst)
 
         _print_health_details(health)
@@ -127,63 +153,52 @@ def monitor_top(ctx, refresh):
         import time
 
         monitor = HealthMonitor()
+        last_fingerprint = None
 
         while True:
-            console.clear()
+            started = time.monotonic()
             healths = monitor.check_all_instances()
 
-            table = Table(title=f"Resource Usage - Refreshing every {refresh}s")
-            table.add_column("Instance", style="cyan")
-            table.add_column("Status", style="bold")
-            table.add_column("CPU %")
-            table.add_column("Memory %")
-            table.add_column("Memory MB")
-            table.add_column("Disk %")
-
-            for health in healths:
-                status_color = {
-                    HealthStatus.HEALTHY: "green",
-                    HealthStatus.WARNING: "yellow",
-                    HealthStatus.CRITICAL: "red",
-                    HealthStatus.UNKNOWN: "dim",
-                }.get(health.status, "white")
-
-                # Colorize values
-                cpu_val = health.cpu_percent
-                cpu_str = f"{cpu_val:.1f}"
-                if cpu_val >= 90:
-                    cpu_str = f"[red]{cpu_str}[/red]"
-                elif cpu_val >= 70:
-                    cpu_str = f"[yellow]{cpu_str}[/yellow]"
-
-                mem_val = health.memory_percent
-                mem_str = f"{mem_val:.1f}"
-                if mem_val >= 85:
-                    mem_str = f"[red]{mem_str}[/red]"
-                elif mem_val >= 70:
-                    mem_str = f"[yellow]{mem_str}[/yellow]"
-
-                disk_val = health.disk_percent
-                disk_str = f"{disk_val:.1f}"
-                if disk_val >= 90:
-                    disk_str = f"[red]{disk_str}[/red]"
-                elif disk_val >= 80:
-                    disk_str = f"[yellow]{disk_str}[/yellow]"
-
-                table.add_row(
-                    health.instance_name,
-                    f"[{status_color}]{health.status}[/{status_color}]",
-                    cpu_str,
-                    mem_str,
-                    str(health.memory_mb),
-                    disk_str,
+            # Only redraw when something visible changed (values at displayed precision)
+            fingerprint = tuple(
+                (
+                    h.instance_name,
+                    h.status,
+                    round(h.cpu_percent, 1),
+                    round(h.memory_percent, 1),
+                    h.memory_mb,
+                    round(h.disk_percent, 1),
                 )
-
-            console.print(table)
-            console.print(f"\n[dim]Press Ctrl+C to exit[/dim]")
+                for h in healths
+            )
+            if fingerprint != last_fingerprint:
+                last_fingerprint = fingerprint
+                console.clear()
+
+                table = Table(title=f"Resource Usage - Refreshing every {refresh}s")
+                table.add_column("Instance", style="cyan")
+                table.add_column("Status", style="bold")
+                table.add_column("CPU %")
+                table.add_column("Memory %")
+                table.add_column("Memory MB")
+                table.add_column("Disk %")
+
+                for health in healths:
+                    table.add_row(
+                        health.instance_name,
+                        _status_label(health.status),
+                        _colorize(health.cpu_percent, _CPU_BOUNDS),
+                        _colorize(health.memory_percent, _MEMORY_BOUNDS),
+                        str(health.memory_mb),
+                        _colorize(health.disk_percent, _DISK_BOUNDS),
+                    )
+
+                console.print(table)
+                console.print(f"\n[dim]Press Ctrl+C to exit[/dim]")
 
             try:
-                time.sleep(refresh)
+                # Probing can take a while; only sleep for what is left of the interval
+                time.sleep(max(0.0, refresh - (time.monotonic() - started)))
             except KeyboardInterrupt:
                 console.print("\n[yellow]Monitoring stopped[/yellow]")
                 break
@@ -234,6 +249,18 @@ def monitor_auto_restart(ctx, instance, max, window, dry_run):
         ctx.exit(1)
 
 
+def _colorize(value: float, bounds: tuple[float, float]) -> str:
+    """Format a percentage, coloured by which threshold band it falls in."""
+    text = f"{value:.1f}"
+    style = _VALUE_STYLES[bisect.bisect_right(bounds, value)]
+    return f"[{style}]{text}[/{style}]" if style else text
+
+
+def _status_label(status) -> str:
+    """Coloured status cell, pre-rendered for known statuses."""
+    return _STATUS_LABELS.get(status) or f"[white]{status}[/white]"
+
+
 def _print_health_table(healths):
     """Print health status table."""
     table = Table(title="Instance Health Status")
@@ -245,16 +272,9 @@ def _print_health_table(healths):
     table.add_column("Last Check")
 
     for health in healths:
-        status_color = {
-            HealthStatus.HEALTHY: "green",
-            HealthStatus.WARNING: "yellow",
-            HealthStatus.CRITICAL: "red",
-            HealthStatus.UNKNOWN: "dim",
-        }.get(health.status, "white")
-
         table.add_row(
             health.instance_name,
-            f"[{status_color}]{health.status}[/{status_color}]",
+            _status_label(health.status),
             f"{health.cpu_percent:.1f}",
             f"{health.memory_percent:.1f}",
             f"{health.disk_percent:.1f}",
@@ -266,12 +286,7 @@ def _print_health_table(healths):
 
 def _print_health_summary(health, verbose):
     """Print health summary for one instance."""
-    status_color = {
-        HealthStatus.HEALTHY: "green",
-        HealthStatus.WARNING: "yellow",
-        HealthStatus.CRITICAL: "red",
-        HealthStatus.UNKNOWN: "dim",
-    }.get(health.status, "white")
+    status_color = _STATUS_COLORS.get(health.status, "white")
 
     console.print(f"[bold]{health.instance_name}[/bold]")
     console.print(f"Status: [{status_color}]{health.status}[/{status_color}]")
@@ -283,12 +298,7 @@ def _print_health_summary(health, verbose):
     if verbose:
         console.print("\nChecks:")
         for check in health.checks:
-            check_color = {
-                HealthStatus.HEALTHY: "green",
-                HealthStatus.WARNING: "yellow",
-                HealthStatus.CRITICAL: "red",
-                HealthStatus.UNKNOWN: "dim",
-            }.get(check.status, "white")
+            check_color = _STATUS_COLORS.get(check.status, "white")
 
             console.print(
                 f"  [{check_color}]✓[{check_color}] {check.name}: {check.message}"
@@ -299,14 +309,9 @@ def _print_health_details(health):
     """Print detailed health information."""
     console.print()
     console.print(f"[bold]Health Check: {health.instance_name}[/bold]")
-    console.print("=" * 50)
+    console.print(_RULE)
 
-    status_color = {
-        HealthStatus.HEALTHY: "green",
-        HealthStatus.WARNING: "yellow",
-        HealthStatus.CRITICAL: "red",
-        HealthStatus.UNKNOWN: "dim",
-    }.get(health.status, "white")
+    status_color = _STATUS_COLORS.get(health.status, "white")
 
     console.print(f"Overall Status: [{status_color}]{health.status.upper()}[/{status_color}]")
     console.print(f"Last Check: {health.last_check.strftime('%Y-%m-%d %H:%M:%S')}")
@@ -322,19 +327,9 @@ def _print_health_details(health):
     # Individual checks
     console.print("[bold]Checks:[/bold]")
     for check in health.checks:
-        check_color = {
-            HealthStatus.HEALTHY: "green",
-            HealthStatus.WARNING: "yellow",
-            HealthStatus.CRITICAL: "red",
-            HealthStatus.UNKNOWN: "dim",
-        }.get(check.status, "white")
-
-        status_symbol = {
-            HealthStatus.HEALTHY: "✓",
-            HealthStatus.WARNING: "⚠",
-            HealthStatus.CRITICAL: "✗",
-            HealthStatus.UNKNOWN: "?",
-        }.get(check.status, "?")
+        check_color = _STATUS_COLORS.get(check.status, "white")
+
+        status_symbol = _STATUS_SYMBOLS.get(check.status, "?")
 
         console.print(
             f"  [{check_color}]{status_symbol}[/{check_color}] {check.name}: {check.message}"
@@ -14,7 +14,7 @@ from odoo_manager.constants import (
     DEPLOYMENT_DOCKER,
     DEPLOYMENT_SOURCE,
 )
-from odoo_manager.deployers.docker import DockerDeployer
+from odoo_manager.deployers.docker import DockerDeployer, container_states
 from odoo_manager.deployers.source import SourceDeployer
 from odoo_manager.exceptions import (
     InstanceAlreadyExistsError,
@@ -158,6 +158,22 @@ class InstanceManager:
             for config in instances_config.list_instances()
         ]
 
+    def running_instance_names(self) -> set[str] | None:
+        """Get the names of Docker instances whose Odoo container is running.
+
+        Uses a single `docker ps` for all instances instead of one per
+        instance. Returns None if Docker could not be queried.
+        """
+        states = container_states()
+        if states is None:
+            return None
+
+        return {
+            config.name
+            for config in self.instances_file.load().list_instances()
+            if states.get(f"odoo-{config.name}") == "running"
+        }
+
     def remove_instance(self, name: str) -> None:
         """Remove an instance."""
         instance = self.get_instance(name)
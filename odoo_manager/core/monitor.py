@@ -3,6 +3,8 @@ Health monitoring for Odoo instances.
 """
 
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -11,6 +13,7 @@ from typing import Any, Optional
 
 import psutil
 
+from odoo_manager.constants import DEPLOYMENT_DOCKER
 from odoo_manager.core.instance import Instance, InstanceManager
 from odoo_manager.utils.output import info, warn, error
 
@@ -24,7 +27,7 @@ class HealthStatus(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class HealthCheckResult:
     """Result of a health check."""
 
@@ -36,7 +39,7 @@ class HealthCheckResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class InstanceHealth:
     """Overall health status for an instance."""
 
@@ -62,6 +65,9 @@ class HealthMonitor:
     DEFAULT_DISK_WARNING = 80.0
     DEFAULT_DISK_CRITICAL = 90.0
 
+    # Upper bound on instances checked concurrently
+    MAX_CHECK_WORKERS = 8
+
     def __init__(
         self,
         cpu_warning: float = DEFAULT_CPU_WARNING,
@@ -87,19 +93,49 @@ class HealthMonitor:
         self.memory_critical = memory_warning
         self.disk_warning = disk_warning
         self.disk_critical = disk_critical
+        self._manager: Optional[InstanceManager] = None
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+        # Prime psutil's CPU counter so later non-blocking reads measure usage since now.
+        # psutil keeps that baseline per thread, so only this (calling) thread samples it.
+        psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
+
+    @property
+    def manager(self) -> InstanceManager:
+        """Lazily created InstanceManager, reused across checks."""
+        if self._manager is None:
+            self._manager = InstanceManager()
+        return self._manager
+
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Lazily created worker pool, kept for repeated rounds (e.g. `monitor top`)."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.MAX_CHECK_WORKERS, thread_name_prefix="health-check"
+            )
+        return self._pool
 
-    def check_instance(self, instance: Instance) -> InstanceHealth:
+    def check_instance(
+        self, instance: Instance, running: Optional[bool] = None, cpu: Optional[float] = None
+    ) -> InstanceHealth:
         """Perform health check on an instance.
 
         Args:
             instance: Instance to check.
+            running: Known running state, if already probed; queried when None.
+            cpu: System CPU percent sampled for this round; measured when None.
 
         Returns:
             InstanceHealth with check results.
         """
         health = InstanceHealth(instance_name=instance.config.name)
 
-        if not instance.is_running():
+        if running is None:
+            running = instance.is_running()
+
+        if not running:
             health.status = HealthStatus.CRITICAL
             health.checks.append(
                 HealthCheckResult(
@@ -113,7 +149,7 @@ class HealthMonitor:
         checks = []
 
         # 1. Container/Process status
-        checks.append(self._check_instance_status(instance))
+        checks.append(self._check_instance_status(instance, running))
 
         # 2. Database connectivity
         checks.append(self._check_database(instance))
@@ -122,7 +158,7 @@ class HealthMonitor:
         checks.append(self._check_http_endpoint(instance))
 
         # 4. Resource usage
-        resource_check = self._check_resources(instance)
+        resource_check = self._check_resources(instance, cpu)
         checks.append(resource_check)
 
         health.cpu_percent = resource_check.value.get("cpu", 0.0) if resource_check.value else 0.0
@@ -154,13 +190,28 @@ class HealthMonitor:
     def check_all_instances(self) -> list[InstanceHealth]:
         """Check health of all instances.
 
+        Checks are I/O bound (Docker stats, HTTP, database), so they run
+        concurrently on a pool that is reused across calls, and the round
+        takes as long as the slowest instance.
+
         Returns:
-            List of InstanceHealth for all instances.
+            List of InstanceHealth for all instances, in configuration order.
         """
-        manager = InstanceManager()
-        instances = manager.list_instances()
+        instances = self.manager.list_instances()
+        if not instances:
+            return []
+
+        # One `docker ps` for every Docker instance instead of probing each one
+        running = self.manager.running_instance_names()
+        # Workers cannot read the CPU baseline kept for this thread, so sample it once here
+        cpu = self._sample_cpu()
 
-        return [self.check_instance(instance) for instance in instances]
+        def check(instance: Instance) -> InstanceHealth:
+            if running is None or instance.config.deployment_type != DEPLOYMENT_DOCKER:
+                return self.check_instance(instance, cpu=cpu)
+            return self.check_instance(instance, instance.config.name in running, cpu)
+
+        return list(self.pool.map(check, instances))
 
     def check_instance_by_name(self, name: str) -> Optional[InstanceHealth]:
         """Check health of an instance by name.
@@ -172,16 +223,20 @@ class HealthMonitor:
             InstanceHealth or None if instance not found.
         """
         try:
-            manager = InstanceManager()
-            instance = manager.get_instance(name)
+            instance = self.manager.get_instance(name)
             return self.check_instance(instance)
         except Exception:
             return None
 
-    def _check_instance_status(self, instance: Instance) -> HealthCheckResult:
+    def _check_instance_status(
+        self, instance: Instance, running: Optional[bool] = None
+    ) -> HealthCheckResult:
         """Check if instance is running."""
         try:
-            if instance.is_running():
+            if running is None:
+                running = instance.is_running()
+
+            if running:
                 return HealthCheckResult(
                     name="Instance Status",
                     status=HealthStatus.HEALTHY,
@@ -264,15 +319,15 @@ class HealthMonitor:
                 message=f"HTTP check error: {e}",
             )
 
-    def _check_resources(self, instance: Instance) -> HealthCheckResult:
+    def _check_resources(self, instance: Instance, cpu: Optional[float] = None) -> HealthCheckResult:
         """Check resource usage."""
         try:
             # Get container stats for Docker deployments
             if instance.config.deployment_type == "docker":
-                stats = self._get_docker_stats(instance)
+                stats = self._get_docker_stats(instance, cpu)
             else:
                 # Get system process stats
-                stats = self._get_process_stats(instance)
+                stats = self._get_process_stats(instance, cpu)
 
             # Determine status based on thresholds
             status = HealthStatus.HEALTHY
@@ -354,7 +409,7 @@ class HealthMonitor:
                 message=f"Log check error: {e}",
             )
 
-    def _get_docker_stats(self, instance: Instance) -> dict[str, Any]:
+    def _get_docker_stats(self, instance: Instance, cpu: Optional[float] = None) -> dict[str, Any]:
         """Get Docker container resource usage."""
         try:
             import docker
@@ -392,11 +447,28 @@ class HealthMonitor:
 
         except Exception as e:
             # Fallback to system stats
-            return self._get_process_stats(instance)
+            return self._get_process_stats(instance, cpu)
+
+    def _sample_cpu(self) -> float:
+        """System CPU percent since the previous sample, spanning at least 0.1s.
 
-    def _get_process_stats(self, instance: Instance) -> dict[str, Any]:
-        """Get system process resource usage."""
-        cpu = psutil.cpu_percent(interval=0.1)
+        Must run on the thread that created the monitor (see __init__).
+        """
+        elapsed = time.monotonic() - self._cpu_sampled_at
+        if elapsed < 0.1:
+            time.sleep(0.1 - elapsed)
+        cpu = psutil.cpu_percent(interval=None)
+        self._cpu_sampled_at = time.monotonic()
+        return cpu
+
+    def _get_process_stats(self, instance: Instance, cpu: Optional[float] = None) -> dict[str, Any]:
+        """Get system process resource usage.
+
+        Without a CPU sample from the caller (one-off checks), measure a short
+        blocking interval; non-blocking reads are only valid on the sampling thread.
+        """
+        if cpu is None:
+            cpu = psutil.cpu_percent(interval=0.1)
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
@@ -21,12 +21,10 @@ from odoo_manager.constants import (
     DEFAULT_POSTGRES_PORT,
     DEFAULT_POSTGRES_USER,
     STATE_ERROR,
-    STATE_RUNNING,
-    STATE_STOPPED,
-    STATE_UNKNOWN,
 )
 from odoo_manager.deployers.base import BaseDeployer
 from odoo_manager.exceptions import DockerError as OdooDockerError
+from odoo_manager.utils import docker as docker_utils
 
 
 def _can_access_docker() -> bool:
@@ -83,6 +81,11 @@ def get_docker_compose_command() -> list[str]:
     return docker_cmd + ["compose"]
 
 
+def container_states() -> dict[str, str] | None:
+    """Get every odoo-* container's state with one `docker ps` (see utils.docker)."""
+    return docker_utils.container_states(_get_docker_command())
+
+
 class DockerDeployer(BaseDeployer):
     """Docker deployment strategy using docker-compose."""
 
@@ -226,18 +229,7 @@ class DockerDeployer(BaseDeployer):
                 text=True,
                 timeout=5
             )
-            status_output = result.stdout.strip()
-
-            if not status_output:
-                return STATE_STOPPED
-
-            status_lower = status_output.lower()
-            if "running" in status_lower or "up" in status_lower:
-                return STATE_RUNNING
-            elif "exited" in status_lower or "dead" in status_lower:
-                return STATE_STOPPED
-            else:
-                return STATE_UNKNOWN
+            return docker_utils.parse_container_status(result.stdout.strip())
         except Exception:
             return STATE_ERROR
 
@@ -8,7 +8,7 @@ Uses Docker Compose for deployment.
 import os
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional
 
 from odoo_manager.config import InstanceConfig, InstancesFile
 from odoo_manager.constants import (
@@ -20,6 +20,17 @@ from odoo_manager.constants import (
     DEFAULT_POSTGRES_PORT,
     DEFAULT_POSTGRES_USER,
 )
+from odoo_manager.utils.docker import container_states, docker_command, parse_container_status
+
+
+def _docker_cmd() -> list[str]:
+    """Get docker command with sudo if needed."""
+    return docker_command()
+
+
+def docker_needs_sudo() -> bool:
+    """Whether Docker commands go through sudo (and so may prompt for a password)."""
+    return _docker_cmd()[0] == "sudo"
 
 
 class Instance:
@@ -49,17 +60,7 @@ class Instance:
 
     def _get_docker_cmd(self) -> list[str]:
         """Get docker command with sudo if needed."""
-        try:
-            result = subprocess.run(
-                ["docker", "info"],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode == 0:
-                return ["docker"]
-        except Exception:
-            pass
-        return ["sudo", "docker"]
+        return _docker_cmd()
 
     def _ensure_data_dir(self) -> None:
         """Ensure data directory exists with proper permissions."""
@@ -192,18 +193,7 @@ volumes:
                 text=True,
                 timeout=5
             )
-            status_output = result.stdout.strip()
-
-            if not status_output:
-                return "stopped"
-
-            status_lower = status_output.lower()
-            if "running" in status_lower or "up" in status_lower:
-                return "running"
-            elif "exited" in status_lower or "dead" in status_lower:
-                return "stopped"
-            else:
-                return "unknown"
+            return parse_container_status(result.stdout.strip())
         except Exception:
             return "error"
 
@@ -234,6 +224,17 @@ volumes:
             result = subprocess.run(cmd, capture_output=True, text=True)
             return result.stdout
 
+    def iter_logs(self, tail: int = 100) -> Iterator[str]:
+        """Yield log lines from the Odoo container as Docker emits them."""
+        docker_cmd = self._get_docker_cmd()
+        cmd = docker_cmd + ["logs", "--tail", str(tail), self.container_name]
+
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+        ) as proc:
+            for line in proc.stdout:
+                yield line.rstrip("\n")
+
     def exec_command(self, command: list[str]) -> str:
         """Execute a command in the Odoo container."""
         docker_cmd = self._get_docker_cmd()
@@ -318,6 +319,23 @@ class InstanceManager:
         instances_config = self._load_config()
         return [Instance(cfg) for cfg in instances_config.list_instances()]
 
+    def snapshot_states(self) -> dict[str, str]:
+        """Get the status of every instance from a single `docker ps` call.
+
+        Returns a mapping of instance name to running, stopped, unknown, or
+        error, matching Instance.status() without one Docker call per instance.
+        """
+        names = [cfg.name for cfg in self._load_config().list_instances()]
+        if not names:
+            return {}
+
+        states = container_states(_docker_cmd())
+        if states is None:
+            # Daemon down, permission denied, sudo refused: state unknown, not stopped
+            return dict.fromkeys(names, "error")
+
+        return {name: states.get(f"odoo-{name}", "stopped") for name in names}
+
     def remove_instance(self, name: str) -> None:
         """Remove an instance."""
         instances_config = self._load_config()
@@ -6,27 +6,202 @@ Simple numbered menu interface like a bash script.
 
 import os
 import subprocess
-from typing import Optional
+import time
+from contextlib import nullcontext
+from functools import lru_cache
+from pathlib import Path
+from typing import ClassVar, NamedTuple, Optional
 
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from odoo_manager.instance import Instance, InstanceManager
-from odoo_manager.git import GitManager
-from odoo_manager.module import ModuleManager
-from odoo_manager.database import DatabaseManager
-from odoo_manager.utils.docker import ensure_docker
+from odoo_manager.instance import Instance, InstanceManager, docker_needs_sudo
 
 console = Console()
 
+# Prompt shown after every action before returning to its menu
+_PAUSE_PROMPT = "\nPress Enter to continue..."
+
+# Seconds a Docker status probe is reused while navigating between menus
+_STATUS_TTL = 3.0
+
+# Seconds the instance list is reused before re-reading the config (picks up CLI changes)
+_INSTANCES_TTL = 10.0
+
+# Minimum seconds between forced refreshes; repeated presses reuse the last probe
+_REFRESH_DEBOUNCE = 1.0
+
+# The main menu never changes, so the panel is built once and re-rendered as-is
+_MAIN_MENU = Panel(
+    """[bold cyan]Odoo Manager[/bold cyan] [dim]v0.2.0[/dim]
+
+[bold]Main Menu[/bold]
+
+  [1]  [cyan]Instances[/cyan]    Manage Odoo instances
+  [2]  [cyan]Git[/cyan]          Connect repository & auto-deploy
+  [3]  [cyan]Modules[/cyan]      Install/uninstall modules
+  [4]  [cyan]Database[/cyan]     Backup & restore databases
+  [5]  [cyan]Logs[/cyan]         View instance logs
+
+  [0]  [dim]Quit[/dim]""",
+    title="Odoo.sh Manager",
+    border_style="cyan"
+)
+
+# Rows shown per page in long pickers (backups accumulate quickly)
+_PAGE_SIZE = 20
+
+# Status markup indexed by running state: _STATUS_MARKUP[instance is running]
+_STATUS_MARKUP = ("[red]STOPPED[/red]", "[green]RUNNING[/green]")
+_STATUS_SUFFIX = (" [red]Stopped[/red]", " [green]Running[/green]")
+
+# Static action menus, built once rather than printed line by line on every redraw
+_INSTANCE_ACTIONS = (
+    "\n[bold]Actions[/bold]\n"
+    "  [1]  Start          Start the instance\n"
+    "  [2]  Stop           Stop the instance\n"
+    "  [3]  Restart        Restart the instance\n"
+    "  [4]  Logs           View logs\n"
+    "  [5]  Shell          Open Odoo shell\n"
+    "  [6]  Remove         Delete instance\n"
+    "\n  [0]  Back"
+)
+_GIT_ACTIONS = (
+    "\n[bold]Actions[/bold]\n"
+    "  [1]  Pull Latest    Pull latest changes from repo\n"
+    "  [2]  Restart        Restart instance after changes\n"
+    "  [3]  List Modules   List available modules\n"
+    "\n  [0]  Back"
+)
+_MODULE_ACTIONS = (
+    "\n[bold]Actions[/bold]\n"
+    "  [1]  Install        Install modules (comma-separated)\n"
+    "  [2]  Uninstall      Uninstall modules\n"
+    "  [3]  Update         Update modules\n"
+    "\n  [0]  Back"
+)
+_DATABASE_ACTIONS = (
+    "\n[bold]Actions[/bold]\n"
+    "  [1]  Backup         Create backup\n"
+    "  [2]  Restore        Restore from backup\n"
+    "  [3]  Duplicate      Duplicate database\n"
+    "  [4]  List Backups   Show backup files\n"
+    "\n  [0]  Back"
+)
+_LOG_OPTIONS = (
+    "\n[bold]Options[/bold]\n"
+    "  [1]  Last 100 lines\n"
+    "  [2]  Last 500 lines\n"
+    "  [3]  Follow mode (live)\n"
+    "\n  [0]  Back"
+)
+
+# Row template for numbered instance pickers, bound once instead of re-parsed per row
+_CHOICE_ROW = "  [{i}]  {name}{extra}".format
+
+# Create-wizard confirmation panel; only the field values change between runs
+_CREATE_SUMMARY = """[bold]Summary[/bold]
+
+  Name:         [cyan]{name}[/cyan]
+  Version:      [cyan]{version}[/cyan]
+  Environment:  [cyan]{environment}[/cyan]
+  {source_info}
+  Port:         [cyan]{port}[/cyan]
+  Git Repo:     [cyan]{git_repo}[/cyan]
+
+  [1]  Create
+  [0]  Cancel""".format
+
+# Create-wizard options as (value, label); numbered from 1, first entry is the default
+_VERSION_OPTIONS = (
+    ("19.0", "19.0 (Latest)"),
+    ("18.0", "18.0"),
+    ("17.0", "17.0"),
+)
+_ENVIRONMENT_OPTIONS = (
+    (Instance.ENV_DEV, "Development    - Fresh DB with demo data"),
+    (Instance.ENV_STAGING, "Staging        - Copy from production database"),
+    (Instance.ENV_PRODUCTION, "Production     - Fresh database, no demo data"),
+)
+_VERSION_MENU = "\n".join(f"  [{i}]  {label}" for i, (_, label) in enumerate(_VERSION_OPTIONS, 1))
+_ENVIRONMENT_MENU = "\n".join(
+    f"  [{i}]  {label}" for i, (_, label) in enumerate(_ENVIRONMENT_OPTIONS, 1)
+)
+_VERSIONS = {str(i): value for i, (value, _) in enumerate(_VERSION_OPTIONS, 1)}
+_ENVIRONMENTS = {str(i): value for i, (value, _) in enumerate(_ENVIRONMENT_OPTIONS, 1)}
+
+
+class InstanceRow(NamedTuple):
+    """Display snapshot of one instance for the instances table."""
+
+    name: str
+    version: str
+    environment: str
+    port: int
+    running: bool
+
+
+@lru_cache(maxsize=256)
+def _row_cells(row: InstanceRow) -> tuple[str, ...]:
+    """Table cells for a row, reused across redraws while its state is unchanged."""
+    return (row.name, row.version, row.environment, str(row.port), _STATUS_MARKUP[row.running])
+
+
+@lru_cache(maxsize=32)
+def _title_panel(title: str) -> Panel:
+    """Screen title panel, reused while a screen loops over its actions."""
+    return Panel(f"[bold cyan]{title}[/bold cyan]", border_style="cyan")
+
+
+def _docker_status(message: str):
+    """Spinner around a Docker call, or a plain line when sudo may prompt.
+
+    A live spinner redraws over sudo's password prompt and can hide it.
+    """
+    if docker_needs_sudo():
+        console.print(message)
+        return nullcontext()
+    return console.status(message)
+
+
+def _parse_choice(choice: str, count: int) -> Optional[int]:
+    """Return the 0-based index for a 1-based menu choice, or None if out of range."""
+    if not choice.isdigit():
+        return None
+    index = int(choice) - 1
+    return index if 0 <= index < count else None
+
 
 class SimpleTUI:
     """Simple TUI with numbered menus."""
 
+    __slots__ = ("_instances", "_last_refresh", "_status_cache", "manager", "running")
+
+    # Main menu choice -> handler method name
+    _MENU_HANDLERS: ClassVar[dict[str, str]] = {
+        "1": "show_instances",
+        "2": "show_git_menu",
+        "3": "show_modules_menu",
+        "4": "show_database_menu",
+        "5": "show_logs_menu",
+    }
+
+    # Instance actions screen choice -> handler method taking the instance
+    _ACTION_HANDLERS: ClassVar[dict[str, str]] = {
+        "1": "do_start",
+        "2": "do_stop",
+        "3": "do_restart",
+        "4": "view_logs",
+        "5": "open_shell",
+    }
+
     def __init__(self):
-        self.running = True
+        self._instances: Optional[tuple[float, list[Instance]]] = None
+        self._last_refresh = 0.0
+        self._status_cache: dict[str, tuple[float, bool]] = {}
         self.manager = InstanceManager()
+        self.running = True
 
     def run(self):
         """Run the TUI."""
@@ -37,23 +212,7 @@ class SimpleTUI:
         """Show main menu."""
         while self.running:
             console.clear()
-            console.print(
-                Panel(
-                    """[bold cyan]Odoo Manager[/bold cyan] [dim]v0.2.0[/dim]
-
-[bold]Main Menu[/bold]
-
-  [1]  [cyan]Instances[/cyan]    Manage Odoo instances
-  [2]  [cyan]Git[/cyan]          Connect repository & auto-deploy
-  [3]  [cyan]Modules[/cyan]      Install/uninstall modules
-  [4]  [cyan]Database[/cyan]     Backup & restore databases
-  [5]  [cyan]Logs[/cyan]         View instance logs
-
-  [0]  [dim]Quit[/dim]""",
-                    title="Odoo.sh Manager",
-                    border_style="cyan"
-                )
-            )
+            console.print(_MAIN_MENU)
 
             choice = input("\nSelect option (0-5): ").strip()
 
@@ -61,23 +220,21 @@ class SimpleTUI:
                 console.print("[yellow]Goodbye![/yellow]")
                 self.running = False
                 return
-            elif choice == "1":
-                self.show_instances()
-            elif choice == "2":
-                self.show_git_menu()
-            elif choice == "3":
-                self.show_modules_menu()
-            elif choice == "4":
-                self.show_database_menu()
-            elif choice == "5":
-                self.show_logs_menu()
+
+            handler = self._MENU_HANDLERS.get(choice)
+            if handler:
+                getattr(self, handler)()
 
     def show_instances(self):
         """Show instances menu."""
+        page = 0
         while True:
             console.clear()
 
-            instances = self.manager.list_instances()
+            instances = self.list_instances()
+            pages = max(1, (len(instances) - 1) // _PAGE_SIZE + 1)
+            page = min(page, pages - 1)
+            start = page * _PAGE_SIZE
 
             if not instances:
                 console.print(Panel("[yellow]No instances found.[/yellow]", border_style="yellow"))
@@ -90,14 +247,17 @@ class SimpleTUI:
                 table.add_column("Port", width=6)
                 table.add_column("Status", width=10)
 
-                for i, inst in enumerate(instances, 1):
-                    status = "[green]RUNNING[/green]" if inst.is_running() else "[red]STOPPED[/red]"
-                    env = inst.config.environment or "dev"
-                    table.add_row(str(i), inst.config.name, inst.config.version, env, str(inst.config.port), status)
+                # Only the visible page is formatted (and probed, if its status is stale)
+                visible = instances[start:start + _PAGE_SIZE]
+                for i, row in enumerate(self._instance_rows(visible), start + 1):
+                    table.add_row(str(i), *_row_cells(row))
 
                 console.print(table)
+                if pages > 1:
+                    console.print(f"[dim]Page {page + 1}/{pages}  [N] Next  [P] Previous[/dim]")
 
             console.print("\n  [C]  Create New Instance")
+            console.print("  [R]  Refresh status")
             console.print("  [0]  Back to main menu")
 
             choice = input("\nSelect option: ").strip().lower()
@@ -106,54 +266,46 @@ class SimpleTUI:
                 return
             elif choice == "c":
                 self.create_instance()
-            elif choice.isdigit() and 1 <= int(choice) <= len(instances):
-                inst = instances[int(choice) - 1]
-                self.show_instance_actions(inst)
+            elif choice == "r":
+                self.refresh_status()
+            elif choice == "n" and page + 1 < pages:
+                page += 1
+            elif choice == "p" and page > 0:
+                page -= 1
+            else:
+                index = _parse_choice(choice, len(instances))
+                if index is not None:
+                    self.show_instance_actions(instances[index])
 
     def show_instance_actions(self, instance: Instance):
         """Show actions for an instance."""
         while True:
             console.clear()
 
-            status_color = "green" if instance.is_running() else "red"
-            status = "RUNNING" if instance.is_running() else "STOPPED"
+            config = instance.config
+            running = self._is_running(instance)
 
-            table = Table(title=f"Instance: {instance.config.name}", show_header=False)
+            table = Table(title=f"Instance: {config.name}", show_header=False)
             table.add_column("Property", style="cyan")
             table.add_column("Value")
 
-            table.add_row("Status", f"[{status_color}]{status}[/{status_color}]")
-            table.add_row("Version", instance.config.version)
-            table.add_row("Environment", instance.config.environment or "dev")
-            table.add_row("Port", f":{instance.config.port}")
-            if instance.config.git_repo:
-                table.add_row("Git Repo", instance.config.git_repo)
+            table.add_row("Status", _STATUS_MARKUP[running])
+            table.add_row("Version", config.version)
+            table.add_row("Environment", config.environment or "dev")
+            table.add_row("Port", f":{config.port}")
+            if config.git_repo:
+                table.add_row("Git Repo", config.git_repo)
 
             console.print(table)
 
-            console.print("\n[bold]Actions[/bold]")
-            console.print("  [1]  Start          Start the instance")
-            console.print("  [2]  Stop           Stop the instance")
-            console.print("  [3]  Restart        Restart the instance")
-            console.print("  [4]  Logs           View logs")
-            console.print("  [5]  Shell          Open Odoo shell")
-            console.print("  [6]  Remove         Delete instance")
-            console.print("\n  [0]  Back")
+            console.print(_INSTANCE_ACTIONS)
 
             choice = input(f"\nSelect action: ").strip()
 
             if choice == "0":
                 return
-            elif choice == "1":
-                self.do_start(instance)
-            elif choice == "2":
-                self.do_stop(instance)
-            elif choice == "3":
-                self.do_restart(instance)
-            elif choice == "4":
-                self.view_logs(instance)
-            elif choice == "5":
-                self.open_shell(instance)
+            elif choice in self._ACTION_HANDLERS:
+                getattr(self, self._ACTION_HANDLERS[choice])(instance)
             elif choice == "6":
                 if input(f"Remove '{instance.config.name}'? (yes/no): ").strip().lower() == "yes":
                     self.do_remove(instance)
@@ -164,36 +316,30 @@ class SimpleTUI:
         console.clear()
 
         # Name
-        console.print(Panel("[bold cyan]Create New Instance[/bold cyan]", border_style="cyan"))
+        console.print(_title_panel("Create New Instance"))
         name = input("\nEnter instance name: ").strip()
         if not name:
             console.print("[yellow]Cancelled[/yellow]")
-            input("\nPress Enter to continue...")
+            input(_PAUSE_PROMPT)
             return
 
         # Version
         console.print("\n[bold]Select Version:[/bold]")
-        console.print("  [1]  19.0 (Latest)")
-        console.print("  [2]  18.0")
-        console.print("  [3]  17.0")
+        console.print(_VERSION_MENU)
         version_choice = input("\nSelect version (1-3): ").strip()
-        versions = {"1": "19.0", "2": "18.0", "3": "17.0"}
-        version = versions.get(version_choice, "19.0")
+        version = _VERSIONS.get(version_choice, _VERSION_OPTIONS[0][0])
 
         # Environment
         console.print("\n[bold]Select Environment:[/bold]")
-        console.print("  [1]  Development    - Fresh DB with demo data")
-        console.print("  [2]  Staging        - Copy from production database")
-        console.print("  [3]  Production     - Fresh database, no demo data")
+        console.print(_ENVIRONMENT_MENU)
         env_choice = input("\nSelect environment (1-3): ").strip()
-        environments = {"1": Instance.ENV_DEV, "2": Instance.ENV_STAGING, "3": Instance.ENV_PRODUCTION}
-        environment = environments.get(env_choice, Instance.ENV_DEV)
+        environment = _ENVIRONMENTS.get(env_choice, _ENVIRONMENT_OPTIONS[0][0])
 
         # For staging, ask for source instance
         source_instance_name = None
         if environment == Instance.ENV_STAGING:
             console.print("\n[bold]Select Production Instance to Copy:[/bold]")
-            prod_instances = [i for i in self.manager.list_instances()
+            prod_instances = [i for i in self.list_instances()
                              if i.config.environment == Instance.ENV_PRODUCTION]
 
             if not prod_instances:
@@ -204,8 +350,9 @@ class SimpleTUI:
                 console.print("  [0]  Fresh database (no copy)")
 
                 source_choice = input("\nSelect source instance: ").strip()
-                if source_choice != "0" and source_choice.isdigit() and 1 <= int(source_choice) <= len(prod_instances):
-                    source_instance_name = prod_instances[int(source_choice) - 1].config.name
+                index = _parse_choice(source_choice, len(prod_instances))
+                if index is not None:
+                    source_instance_name = prod_instances[index].config.name
                     console.print(f"[cyan]Will copy database from: {source_instance_name}[/cyan]")
 
         # Port
@@ -218,44 +365,50 @@ class SimpleTUI:
         # Summary
         source_info = f"Source DB: {source_instance_name}" if source_instance_name else "Source DB: Fresh database"
         console.print(Panel(
-            f"""[bold]Summary[/bold]
-
-  Name:         [cyan]{name}[/cyan]
-  Version:      [cyan]{version}[/cyan]
-  Environment:  [cyan]{environment}[/cyan]
-  {source_info}
-  Port:         [cyan]{port}[/cyan]
-  Git Repo:     [cyan]{git_repo or 'None'}[/cyan]
-
-  [1]  Create
-  [0]  Cancel""",
+            _CREATE_SUMMARY(
+                name=name,
+                version=version,
+                environment=environment,
+                source_info=source_info,
+                port=port,
+                git_repo=git_repo or "None",
+            ),
             border_style="cyan"
         ))
 
         confirm = input("\nConfirm? (1=Create, 0=Cancel): ").strip()
         if confirm != "1":
             console.print("[yellow]Cancelled[/yellow]")
-            input("\nPress Enter to continue...")
+            input(_PAUSE_PROMPT)
             return
 
+        # Imported here: odoo_manager.utils pulls in psycopg2, which the menus don't need
+        from odoo_manager.database import DatabaseManager
+        from odoo_manager.git import GitManager
+        from odoo_manager.utils.docker import ensure_docker
+
         # Ensure Docker is installed
         console.print("\n[dim]Checking Docker...[/dim]")
         success, message = ensure_docker(verbose=True)
         if not success:
             console.print(f"[red]{message}[/red]")
-            input("\nPress Enter to continue...")
+            input(_PAUSE_PROMPT)
             return
 
-        # Create instance
-        console.print("[dim]Creating instance...[/dim]")
+        # Create instance (may pull images for minutes; keep a spinner up meanwhile)
         try:
-            instance = self.manager.create_instance(
-                name=name,
-                version=version,
-                port=port,
-                environment=environment,
-                git_repo=git_repo,
-            )
+            try:
+                with _docker_status("[dim]Creating instance...[/dim]"):
+                    instance = self.manager.create_instance(
+                        name=name,
+                        version=version,
+                        port=port,
+                        environment=environment,
+                        git_repo=git_repo,
+                    )
+            finally:
+                # The config may be saved even if creation fails part-way
+                self._instances = None
             console.print(f"[green]Instance '{name}' created![/green]")
 
             # Clone git repo if provided
@@ -268,7 +421,6 @@ class SimpleTUI:
             # For staging, copy database from source
             if environment == Instance.ENV_STAGING and source_instance_name:
                 console.print(f"[dim]Copying database from {source_instance_name}...[/dim]")
-                from odoo_manager.database import DatabaseManager
                 source_inst = self.manager.get_instance(source_instance_name)
                 if source_inst:
                     db_mgr = DatabaseManager(source_inst)
@@ -280,47 +432,37 @@ class SimpleTUI:
                     console.print(f"[green]Database copied![/green]")
 
             # Start instance
-            console.print(f"[dim]Starting instance...[/dim]")
-            instance.start()
+            self._status_cache.pop(name, None)
+            with _docker_status("[dim]Starting instance...[/dim]"):
+                instance.start()
             console.print(f"[green]Instance '{name}' started![/green]")
             console.print(f"\n[cyan]Access at: http://localhost:{port}[/cyan]")
 
-            input("\nPress Enter to continue...")
+            input(_PAUSE_PROMPT)
         except Exception as e:
             console.print(f"[red]Failed: {e}[/red]")
-            input("\nPress Enter to continue...")
+            input(_PAUSE_PROMPT)
 
     def show_git_menu(self):
         """Show Git management menu."""
-        console.clear()
-        console.print(Panel("[bold cyan]Git Repository Management[/bold cyan]", border_style="cyan"))
-
-        instances = self.manager.list_instances()
-        if not instances:
-            console.print("[yellow]No instances found. Create an instance first.[/yellow]")
-            input("\nPress Enter to continue...")
-            return
-
-        console.print("\n[bold]Select Instance:[/bold]")
-        for i, inst in enumerate(instances, 1):
-            repo_info = inst.config.git_repo or "No repo"
-            console.print(f"  [{i}]  {inst.config.name} - {repo_info}")
-        console.print("\n  [0]  Back")
-
-        choice = input("\nSelect instance: ").strip()
-        if choice == "0":
-            return
-        elif choice.isdigit() and 1 <= int(choice) <= len(instances):
-            inst = instances[int(choice) - 1]
+        inst = self._select_instance(
+            "Git Repository Management",
+            self.list_instances(),
+            "No instances found. Create an instance first.",
+            lambda inst: f" - {inst.config.git_repo or 'No repo'}",
+        )
+        if inst:
             self.show_instance_git(inst)
 
     def show_instance_git(self, instance: Instance):
         """Show Git operations for an instance."""
+        from odoo_manager.git import GitManager
+
+        git_mgr = GitManager(instance)
+
         while True:
             console.clear()
-            console.print(Panel(f"[bold cyan]Git: {instance.config.name}[/bold cyan]", border_style="cyan"))
-
-            git_mgr = GitManager(instance)
+            console.print(_title_panel(f"Git: {instance.config.name}"))
 
             try:
                 branch = git_mgr.get_current_branch()
@@ -330,11 +472,7 @@ class SimpleTUI:
             except Exception:
                 console.print("  [yellow]No Git repository found[/yellow]")
 
-            console.print("\n[bold]Actions[/bold]")
-            console.print("  [1]  Pull Latest    Pull latest changes from repo")
-            console.print("  [2]  Restart        Restart instance after changes")
-            console.print("  [3]  List Modules   List available modules")
-            console.print("\n  [0]  Back")
+            console.print(_GIT_ACTIONS)
 
             choice = input("\nSelect action: ").strip()
 
@@ -347,15 +485,16 @@ class SimpleTUI:
                     console.print(f"[green]{result}[/green]")
                 except Exception as e:
                     console.print(f"[red]{e}[/red]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
             elif choice == "2":
                 try:
                     console.print("\n[dim]Restarting instance...[/dim]")
+                    self._status_cache.pop(instance.config.name, None)
                     instance.restart()
                     console.print("[green]Restarted![/green]")
                 except Exception as e:
                     console.print(f"[red]{e}[/red]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
             elif choice == "3":
                 try:
                     modules = git_mgr.list_modules()
@@ -366,38 +505,27 @@ class SimpleTUI:
                         console.print(f"  ... and {len(modules) - 20} more")
                 except Exception as e:
                     console.print(f"[red]{e}[/red]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
 
     def show_modules_menu(self):
         """Show modules menu."""
-        console.clear()
-        console.print(Panel("[bold cyan]Module Management[/bold cyan]", border_style="cyan"))
-
-        instances = [i for i in self.manager.list_instances() if i.is_running()]
-        if not instances:
-            console.print("[yellow]No running instances found.[/yellow]")
-            input("\nPress Enter to continue...")
-            return
-
-        console.print("\n[bold]Select Instance:[/bold]")
-        for i, inst in enumerate(instances, 1):
-            console.print(f"  [{i}]  {inst.config.name}")
-        console.print("\n  [0]  Back")
-
-        choice = input("\nSelect instance: ").strip()
-        if choice == "0":
-            return
-        elif choice.isdigit() and 1 <= int(choice) <= len(instances):
-            inst = instances[int(choice) - 1]
+        inst = self._select_instance(
+            "Module Management",
+            [i for i in self.list_instances() if self._is_running(i)],
+            "No running instances found.",
+        )
+        if inst:
             self.show_instance_modules(inst)
 
     def show_instance_modules(self, instance: Instance):
         """Show modules for an instance."""
+        from odoo_manager.module import ModuleManager
+
         mod_mgr = ModuleManager(instance)
 
         while True:
             console.clear()
-            console.print(Panel(f"[bold cyan]Modules: {instance.config.name}[/bold cyan]", border_style="cyan"))
+            console.print(_title_panel(f"Modules: {instance.config.name}"))
 
             try:
                 modules = mod_mgr.list_modules()
@@ -415,11 +543,7 @@ class SimpleTUI:
             except Exception as e:
                 console.print(f"[red]Error listing modules: {e}[/red]")
 
-            console.print("\n[bold]Actions[/bold]")
-            console.print("  [1]  Install        Install modules (comma-separated)")
-            console.print("  [2]  Uninstall      Uninstall modules")
-            console.print("  [3]  Update         Update modules")
-            console.print("\n  [0]  Back")
+            console.print(_MODULE_ACTIONS)
 
             choice = input("\nSelect action: ").strip()
 
@@ -436,7 +560,7 @@ class SimpleTUI:
                         console.print(result[:500])
                     except Exception as e:
                         console.print(f"[red]{e}[/red]")
-                    input("\nPress Enter to continue...")
+                    input(_PAUSE_PROMPT)
             elif choice == "2":
                 mods = input("\nEnter module names (comma-separated): ").strip()
                 if mods:
@@ -447,7 +571,7 @@ class SimpleTUI:
                         console.print("[green]Done![/green]")
                     except Exception as e:
                         console.print(f"[red]{e}[/red]")
-                    input("\nPress Enter to continue...")
+                    input(_PAUSE_PROMPT)
             elif choice == "3":
                 mods = input("\nEnter module names (comma-separated, or 'all'): ").strip()
                 console.print(f"\n[dim]Updating: {mods}[/dim]")
@@ -457,38 +581,25 @@ class SimpleTUI:
                     console.print("[green]Done![/green]")
                 except Exception as e:
                     console.print(f"[red]{e}[/red]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
 
     def show_database_menu(self):
         """Show database menu."""
-        console.clear()
-        console.print(Panel("[bold cyan]Database Management[/bold cyan]", border_style="cyan"))
-
-        instances = self.manager.list_instances()
-        if not instances:
-            console.print("[yellow]No instances found.[/yellow]")
-            input("\nPress Enter to continue...")
-            return
-
-        console.print("\n[bold]Select Instance:[/bold]")
-        for i, inst in enumerate(instances, 1):
-            console.print(f"  [{i}]  {inst.config.name}")
-        console.print("\n  [0]  Back")
-
-        choice = input("\nSelect instance: ").strip()
-        if choice == "0":
-            return
-        elif choice.isdigit() and 1 <= int(choice) <= len(instances):
-            inst = instances[int(choice) - 1]
+        inst = self._select_instance(
+            "Database Management", self.list_instances(), "No instances found."
+        )
+        if inst:
             self.show_instance_databases(inst)
 
     def show_instance_databases(self, instance: Instance):
         """Show databases for an instance."""
+        from odoo_manager.database import DatabaseManager
+
         db_mgr = DatabaseManager(instance)
 
         while True:
             console.clear()
-            console.print(Panel(f"[bold cyan]Databases: {instance.config.name}[/bold cyan]", border_style="cyan"))
+            console.print(_title_panel(f"Databases: {instance.config.name}"))
 
             try:
                 databases = db_mgr.list_databases()
@@ -497,12 +608,7 @@ class SimpleTUI:
             except Exception as e:
                 console.print(f"[red]Error: {e}[/red]")
 
-            console.print("\n[bold]Actions[/bold]")
-            console.print("  [1]  Backup         Create backup")
-            console.print("  [2]  Restore        Restore from backup")
-            console.print("  [3]  Duplicate      Duplicate database")
-            console.print("  [4]  List Backups   Show backup files")
-            console.print("\n  [0]  Back")
+            console.print(_DATABASE_ACTIONS)
 
             choice = input("\nSelect action: ").strip()
 
@@ -515,26 +621,24 @@ class SimpleTUI:
                     console.print(f"[green]Backup saved: {backup_path}[/green]")
                 except Exception as e:
                     console.print(f"[red]{e}[/red]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
             elif choice == "2":
                 backups = db_mgr.list_backups()
                 if not backups:
                     console.print("[yellow]No backups found[/yellow]")
-                    input("\nPress Enter to continue...")
+                    input(_PAUSE_PROMPT)
                     continue
                 console.print("\nAvailable backups:")
-                for i, b in enumerate(backups, 1):
-                    console.print(f"  [{i}]  {b['name']}")
-                choice = input("\nSelect backup: ").strip()
-                if choice.isdigit() and 1 <= int(choice) <= len(backups):
-                    backup = backups[int(choice) - 1]
+                index = self._pick_paged([b["name"] for b in backups], "\nSelect backup: ")
+                if index is not None:
+                    backup = backups[index]
                     try:
                         console.print("\n[dim]Restoring...[/dim]")
                         db_mgr.restore(Path(backup['path']))
                         console.print("[green]Restored![/green]")
                     except Exception as e:
                         console.print(f"[red]{e}[/red]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
             elif choice == "3":
                 db_name = input("\nNew database name: ").strip()
                 if db_name:
@@ -544,119 +648,217 @@ class SimpleTUI:
                         console.print("[green]Done![/green]")
                     except Exception as e:
                         console.print(f"[red]{e}[/red]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
             elif choice == "4":
                 backups = db_mgr.list_backups()
                 if backups:
                     console.print("\n[dim]Backup files:[/dim]")
-                    for b in backups:
-                        console.print(f"  - {b['name']} ({b['size']} bytes)")
+                    self._pick_paged(
+                        [f"{b['name']} ({b['size']} bytes)" for b in backups],
+                        _PAUSE_PROMPT,
+                    )
                 else:
                     console.print("[yellow]No backups found[/yellow]")
-                input("\nPress Enter to continue...")
+                    input(_PAUSE_PROMPT)
 
     def show_logs_menu(self):
         """Show logs menu."""
-        console.clear()
-        console.print(Panel("[bold cyan]View Logs[/bold cyan]", border_style="cyan"))
-
-        instances = self.manager.list_instances()
-        if not instances:
-            console.print("[yellow]No instances found.[/yellow]")
-            input("\nPress Enter to continue...")
-            return
-
-        console.print("\n[bold]Select Instance:[/bold]")
-        for i, inst in enumerate(instances, 1):
-            status = "[green]Running[/green]" if inst.is_running() else "[red]Stopped[/red]"
-            console.print(f"  [{i}]  {inst.config.name} {status}")
-        console.print("\n  [0]  Back")
-
-        choice = input("\nSelect instance: ").strip()
-        if choice == "0":
-            return
-        elif choice.isdigit() and 1 <= int(choice) <= len(instances):
-            inst = instances[int(choice) - 1]
+        inst = self._select_instance(
+            "View Logs",
+            self.list_instances(),
+            "No instances found.",
+            lambda inst: _STATUS_SUFFIX[self._is_running(inst)],
+        )
+        if inst:
             self.view_logs(inst)
 
     def view_logs(self, instance: Instance):
         """View logs for an instance."""
         console.clear()
-        console.print(Panel(f"[bold cyan]Logs: {instance.config.name}[/bold cyan]", border_style="cyan"))
+        console.print(_title_panel(f"Logs: {instance.config.name}"))
 
-        console.print("\n[bold]Options[/bold]")
-        console.print("  [1]  Last 100 lines")
-        console.print("  [2]  Last 500 lines")
-        console.print("  [3]  Follow mode (live)")
-        console.print("\n  [0]  Back")
+        console.print(_LOG_OPTIONS)
 
         choice = input("\nSelect option: ").strip()
 
         if choice == "0":
             return
-        elif choice == "1":
-            logs = instance.get_logs(tail=100)
-            console.print(f"\n{logs}")
-            input("\nPress Enter to continue...")
-        elif choice == "2":
-            logs = instance.get_logs(tail=500)
-            console.print(f"\n{logs[:2000]}")  # Limit output
-            input("\nPress Enter to continue...")
+        elif choice in ("1", "2"):
+            console.print()
+            # The 500-line view keeps its 2000-character cap
+            remaining = None if choice == "1" else 2000
+            # Print lines as Docker produces them instead of buffering the whole tail
+            for line in instance.iter_logs(tail=100 if choice == "1" else 500):
+                if remaining is not None:
+                    line = line[:remaining]
+                    remaining -= len(line) + 1
+                console.print(line, markup=False, highlight=False)
+                if remaining is not None and remaining <= 0:
+                    break
+            input(_PAUSE_PROMPT)
         elif choice == "3":
             console.print("\n[dim]Following logs... (Press Ctrl+C to stop)[/dim]\n")
             try:
                 instance.get_logs(follow=True)
             except KeyboardInterrupt:
                 console.print("\n\n[yellow]Log following stopped[/yellow]")
-                input("\nPress Enter to continue...")
+                input(_PAUSE_PROMPT)
+
+    def list_instances(self) -> list[Instance]:
+        """Return the configured instances, re-read once older than _INSTANCES_TTL."""
+        now = time.monotonic()
+        if self._instances is None or now - self._instances[0] >= _INSTANCES_TTL:
+            self._instances = (now, self.manager.list_instances())
+        return self._instances[1]
+
+    def refresh_status(self):
+        """Drop cached instances and status probes so the next screen re-reads both."""
+        now = time.monotonic()
+        if now - self._last_refresh < _REFRESH_DEBOUNCE:
+            return
+        self._last_refresh = now
+        self._instances = None
+        self._status_cache.clear()
+
+    def _is_running(self, instance: Instance) -> bool:
+        """Return instance.is_running(), reusing a probe younger than _STATUS_TTL."""
+        name = instance.config.name
+        now = time.monotonic()
+        cached = self._status_cache.get(name)
+        if cached and now - cached[0] < _STATUS_TTL:
+            return cached[1]
+        running = instance.is_running()
+        self._status_cache[name] = (now, running)
+        return running
+
+    def _instance_rows(self, instances: list[Instance]) -> list[InstanceRow]:
+        """Snapshot the fields the instances table displays.
+
+        When any cached status is stale, every instance is re-checked with a
+        single `docker ps` instead of one Docker call per instance.
+        """
+        now = time.monotonic()
+        if any(
+            now - self._status_cache.get(inst.config.name, (float("-inf"), False))[0] >= _STATUS_TTL
+            for inst in instances
+        ):
+            with _docker_status("[dim]Checking instances...[/dim]"):
+                states = self.manager.snapshot_states()
+            now = time.monotonic()
+            for name, state in states.items():
+                self._status_cache[name] = (now, state == "running")
+
+        return [
+            InstanceRow(
+                name=inst.config.name,
+                version=inst.config.version,
+                environment=inst.config.environment or "dev",
+                port=inst.config.port,
+                running=self._is_running(inst),
+            )
+            for inst in instances
+        ]
+
+    def _pick_paged(self, labels: list[str], prompt: str) -> Optional[int]:
+        """Show labels one page at a time and return the chosen index, if any."""
+        pages = (len(labels) - 1) // _PAGE_SIZE + 1
+        page = 0
+        while True:
+            start = page * _PAGE_SIZE
+            for i, label in enumerate(labels[start:start + _PAGE_SIZE], start + 1):
+                console.print(f"  [{i}]  {label}")
+            if pages > 1:
+                console.print(f"\n[dim]Page {page + 1}/{pages}  [N] Next  [P] Previous[/dim]")
+
+            choice = input(prompt).strip().lower()
+            if choice == "n" and page + 1 < pages:
+                page += 1
+            elif choice == "p" and page > 0:
+                page -= 1
+            else:
+                return _parse_choice(choice, len(labels))
+
+    def _select_instance(
+        self, title: str, instances: list[Instance], empty_message: str, extra=None
+    ) -> Optional[Instance]:
+        """Show a titled instance picker and return the chosen instance, if any."""
+        console.clear()
+        console.print(_title_panel(title))
+
+        if not instances:
+            console.print(f"[yellow]{empty_message}[/yellow]")
+            input(_PAUSE_PROMPT)
+            return None
+
+        self._print_instance_choices(instances, extra)
+
+        index = _parse_choice(input("\nSelect instance: ").strip(), len(instances))
+        return instances[index] if index is not None else None
+
+    def _print_instance_choices(self, instances: list[Instance], extra=None):
+        """Print a numbered instance picker as a single block."""
+        console.print("\n[bold]Select Instance:[/bold]")
+        console.print(
+            "\n".join(
+                _CHOICE_ROW(i=i, name=inst.config.name, extra=extra(inst) if extra else "")
+                for i, inst in enumerate(instances, 1)
+            )
+        )
+        console.print("\n  [0]  Back")
 
     # ===== Instance Actions =====
     def do_start(self, instance: Instance):
         """Start an instance."""
-        console.print(f"\n[dim]Starting {instance.config.name}...[/dim]")
+        self._status_cache.pop(instance.config.name, None)
         try:
-            instance.start()
+            with _docker_status(f"[dim]Starting {instance.config.name}...[/dim]"):
+                instance.start()
             console.print(f"[green]Started![/green]")
         except Exception as e:
             console.print(f"[red]{e}[/red]")
-        input("\nPress Enter to continue...")
+        input(_PAUSE_PROMPT)
 
     def do_stop(self, instance: Instance):
         """Stop an instance."""
-        console.print(f"\n[dim]Stopping {instance.config.name}...[/dim]")
+        self._status_cache.pop(instance.config.name, None)
         try:
-            instance.stop()
+            with _docker_status(f"[dim]Stopping {instance.config.name}...[/dim]"):
+                instance.stop()
             console.print(f"[yellow]Stopped![/yellow]")
         except Exception as e:
             console.print(f"[red]{e}[/red]")
-        input("\nPress Enter to continue...")
+        input(_PAUSE_PROMPT)
 
     def do_restart(self, instance: Instance):
         """Restart an instance."""
-        console.print(f"\n[dim]Restarting {instance.config.name}...[/dim]")
+        self._status_cache.pop(instance.config.name, None)
         try:
-            instance.restart()
+            with _docker_status(f"[dim]Restarting {instance.config.name}...[/dim]"):
+                instance.restart()
             console.print(f"[yellow]Restarted![/yellow]")
         except Exception as e:
             console.print(f"[red]{e}[/red]")
-        input("\nPress Enter to continue...")
+        input(_PAUSE_PROMPT)
 
     def do_remove(self, instance: Instance):
         """Remove an instance."""
-        console.print(f"\n[dim]Removing {instance.config.name}...[/dim]")
+        self._status_cache.pop(instance.config.name, None)
         try:
-            instance.remove()
-            self.manager.remove_instance(instance.config.name)
+            with _docker_status(f"[dim]Removing {instance.config.name}...[/dim]"):
+                instance.remove()
+                self.manager.remove_instance(instance.config.name)
             console.print(f"[red]Removed![/red]")
         except Exception as e:
             console.print(f"[red]{e}[/red]")
-        input("\nPress Enter to continue...")
+        finally:
+            self._instances = None
+        input(_PAUSE_PROMPT)
 
     def open_shell(self, instance: Instance):
         """Open Odoo Python shell."""
-        if not instance.is_running():
+        if not self._is_running(instance):
             console.print("[yellow]Instance must be running first[/yellow]")
-            input("\nPress Enter to continue...")
+            input(_PAUSE_PROMPT)
             return
 
         console.print(f"\n[dim]Opening shell for {instance.config.name}...[/dim]")
@@ -1,47 +1,45 @@
-"""Utility modules."""
-
-from odoo_manager.utils.output import (
-    success,
-    error,
-    warning,
-    info,
-    print_table,
-    print_panel,
-    Spinner,
-)
-from odoo_manager.utils.postgres import (
-    get_postgres_connection,
-    list_databases,
-    database_exists,
-    create_database,
-    drop_database,
-    duplicate_database,
-    check_connection,
-)
-from odoo_manager.utils.docker import (
-    is_docker_installed,
-    is_docker_running,
-    install_docker,
-    ensure_docker,
-)
-
-__all__ = [
-    "success",
-    "error",
-    "warning",
-    "info",
-    "print_table",
-    "print_panel",
-    "Spinner",
-    "get_postgres_connection",
-    "list_databases",
-    "database_exists",
-    "create_database",
-    "drop_database",
-    "duplicate_database",
-    "check_connection",
-    "is_docker_installed",
-    "is_docker_running",
-    "install_docker",
-    "ensure_docker",
-]
+"""Utility modules.
+
+Re-exports are resolved lazily (PEP 562), so importing one submodule such as
+``odoo_manager.utils.output`` does not also load psycopg2 or the Docker helpers.
+"""
+
+from importlib import import_module
+from typing import Any
+
+# Re-exported name -> submodule that defines it
+_EXPORTS = {
+    "success": "output",
+    "error": "output",
+    "warning": "output",
+    "info": "output",
+    "print_table": "output",
+    "print_panel": "output",
+    "Spinner": "output",
+    "get_postgres_connection": "postgres",
+    "list_databases": "postgres",
+    "database_exists": "postgres",
+    "create_database": "postgres",
+    "drop_database": "postgres",
+    "duplicate_database": "postgres",
+    "check_connection": "postgres",
+    "is_docker_installed": "docker",
+    "is_docker_running": "docker",
+    "install_docker": "docker",
+    "ensure_docker": "docker",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
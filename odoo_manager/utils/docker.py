@@ -3,18 +3,89 @@ Docker installation and management utilities.
 """
 
 import os
+import shlex
+import socket
 import subprocess
 import shutil
+import time
 from pathlib import Path
 
+# Seconds the installed/running answers are reused; installs and starts invalidate them
+_INSTALLED_TTL = 60.0
+_RUNNING_TTL = 2.0
+
+# Default daemon socket, used unless DOCKER_HOST points elsewhere
+_DEFAULT_DOCKER_SOCKET = "/var/run/docker.sock"
+
+_installed_cache: tuple[float, bool] | None = None
+_running_cache: tuple[float, bool] | None = None
+_command_cache: list[str] | None = None
+
+
+def invalidate_docker_cache() -> None:
+    """Forget cached Docker installed/running/command state (after installing or starting it)."""
+    global _installed_cache, _running_cache, _command_cache
+    _installed_cache = None
+    _running_cache = None
+    _command_cache = None
+
 
 def is_docker_installed() -> bool:
     """Check if Docker is installed."""
-    return shutil.which("docker") is not None
+    global _installed_cache
+    now = time.monotonic()
+    if _installed_cache and now - _installed_cache[0] < _INSTALLED_TTL:
+        return _installed_cache[1]
+
+    installed = shutil.which("docker") is not None
+    _installed_cache = (now, installed)
+    return installed
 
 
 def is_docker_running() -> bool:
     """Check if Docker daemon is running."""
+    global _running_cache
+    now = time.monotonic()
+    if _running_cache and now - _running_cache[0] < _RUNNING_TTL:
+        return _running_cache[1]
+
+    running = _probe_docker_running()
+    _running_cache = (now, running)
+    return running
+
+
+def _docker_socket_path() -> str | None:
+    """Return the daemon's Unix socket path, or None if it isn't reached over one."""
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    host = os.environ.get("DOCKER_HOST")
+    if not host:
+        return _DEFAULT_DOCKER_SOCKET
+    if host.startswith("unix://"):
+        return host[len("unix://"):]
+    return None
+
+
+def _probe_docker_running() -> bool:
+    """Ask the Docker daemon whether it is up, bypassing the cache.
+
+    Pings the API over its Unix socket directly; the `docker info` CLI is
+    only spawned when the socket is missing, unreadable, or not Unix.
+    """
+    sock_path = _docker_socket_path()
+    if sock_path:
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(0.5)
+                sock.connect(sock_path)
+                sock.sendall(b"GET /_ping HTTP/1.0\r\nHost: docker\r\n\r\n")
+                return b" 200 " in sock.recv(64)
+        except ConnectionRefusedError:
+            return False
+        except OSError:
+            # Missing socket, no permission, or timeout: let the CLI decide
+            pass
+
     try:
         result = subprocess.run(
             ["docker", "info"],
@@ -26,6 +97,71 @@ def is_docker_running() -> bool:
         return False
 
 
+def docker_command() -> list[str]:
+    """Get the docker command, prefixed with sudo when `docker info` fails without it.
+
+    The answer only changes when Docker is installed, started, or the user joins
+    the docker group, so it is kept until invalidate_docker_cache().
+    """
+    global _command_cache
+    if _command_cache is None:
+        try:
+            result = subprocess.run(
+                ["docker", "info"],
+                capture_output=True,
+                timeout=5
+            )
+            _command_cache = ["docker"] if result.returncode == 0 else ["sudo", "docker"]
+        except (OSError, subprocess.TimeoutExpired):
+            _command_cache = ["sudo", "docker"]
+    return list(_command_cache)
+
+
+def parse_container_status(status_output: str) -> str:
+    """Map a `docker ps` Status column to running, stopped, or unknown."""
+    if not status_output:
+        return "stopped"
+
+    status_lower = status_output.lower()
+    if "running" in status_lower or "up" in status_lower:
+        return "running"
+    elif "exited" in status_lower or "dead" in status_lower:
+        return "stopped"
+    else:
+        return "unknown"
+
+
+def container_states(docker_cmd: list[str], name_filter: str = "odoo-") -> dict[str, str] | None:
+    """Get the state of every matching container from a single `docker ps -a`.
+
+    Args:
+        docker_cmd: Docker command prefix, e.g. ["docker"] or ["sudo", "docker"].
+        name_filter: Container name filter passed to `docker ps`.
+
+    Returns:
+        Mapping of container name to running, stopped, or unknown, or None
+        if Docker could not be queried. Containers that do not exist are absent.
+    """
+    try:
+        result = subprocess.run(
+            docker_cmd + ["ps", "-a", "--filter", f"name={name_filter}",
+                          "--format", "{{.Names}}\t{{.Status}}"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (subprocess.SubprocessError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+
+    return {
+        name: parse_container_status(status.strip())
+        for name, _, status in (line.partition("\t") for line in result.stdout.splitlines())
+        if name
+    }
+
+
 def install_docker() -> tuple[bool, str]:
     """
     Install Docker automatically.
@@ -41,41 +177,34 @@ def install_docker() -> tuple[bool, str]:
 
     # Detect the package manager and OS
     if shutil.which("apt-get"):
-        return _install_docker_debian()
+        installer = _install_docker_debian
     elif shutil.which("yum"):
-        return _install_docker_rhel()
+        installer = _install_docker_rhel
     elif shutil.which("dnf"):
-        return _install_docker_fedora()
+        installer = _install_docker_fedora
     else:
         return False, "Unsupported package manager. Please install Docker manually."
 
+    try:
+        return installer()
+    finally:
+        invalidate_docker_cache()
+
 
 def _install_docker_debian() -> tuple[bool, str]:
     """Install Docker on Debian/Ubuntu systems."""
-    commands = [
-        # Update package index
-        ["sudo", "apt-get", "update"],
-        # Install prerequisites
-        ["sudo", "apt-get", "install", "-y", "curl", "ca-certificates", "gnupg"],
-        # Add Docker's official GPG key
-        ["install", "-m", "0755", "-d", "/etc/apt/keyrings"],
-        ["curl", "-fsSL", "https://download.docker.com/linux/ubuntu/gpg"],
-        # Use the convenience script (most reliable)
-        ["curl", "-fsSL", "https://get.docker.com", "-o", "/tmp/get-docker.sh"],
-        ["sudo", "sh", "/tmp/get-docker.sh"],
-    ]
-
-    # Use the official Docker convenience script (most reliable method)
+    # Use the official Docker convenience script (most reliable method), piped straight
+    # into sh and followed by the docker group change, all in one shell
     try:
-        # Download and run the Docker installation script
-        subprocess.run(
-            ["curl", "-fsSL", "https://get.docker.com", "-o", "/tmp/get-docker.sh"],
-            check=True,
-            capture_output=True
+        user = _invoking_user()
+        script = (
+            "set -o pipefail; "
+            "curl -fsSL https://get.docker.com | sudo sh && "
+            f"{{ sudo usermod -aG docker {shlex.quote(user)} || true; }}"
         )
 
         result = subprocess.run(
-            ["sudo", "sh", "/tmp/get-docker.sh"],
+            ["bash", "-c", script],
             capture_output=True,
             text=True
         )
@@ -83,20 +212,8 @@ def _install_docker_debian() -> tuple[bool, str]:
         if result.returncode != 0:
             return False, f"Installation failed: {result.stderr}"
 
-        # Add current user to docker group
-        user = os.environ.get("USER", os.environ.get("USERNAME", "ubuntu"))
-        subprocess.run(
-            ["sudo", "usermod", "-aG", "docker", user],
-            capture_output=True
-        )
-
-        # Clean up
-        subprocess.run(["rm", "-f", "/tmp/get-docker.sh"], capture_output=True)
-
         return True, "Docker installed successfully. Please log out and log back in for group changes to take effect."
 
-    except subprocess.CalledProcessError as e:
-        return False, f"Installation failed: {e.stderr}"
     except Exception as e:
         return False, f"Installation failed: {e}"
 
@@ -104,22 +221,13 @@ def _install_docker_debian() -> tuple[bool, str]:
 def _install_docker_rhel() -> tuple[bool, str]:
     """Install Docker on RHEL/CentOS systems."""
     try:
-        # Set up the repository
-        subprocess.run(
-            ["sudo", "yum", "install", "-y", "yum-utils"],
-            check=True,
-            capture_output=True
-        )
-        subprocess.run(
-            ["sudo", "yum-config-manager", "--add-repo",
-             "https://download.docker.com/linux/centos/docker-ce.repo"],
-            check=True,
-            capture_output=True
-        )
-        # Install Docker
+        # Set up the repository and install Docker in one sudo shell
         result = subprocess.run(
-            ["sudo", "yum", "install", "-y", "docker-ce", "docker-ce-cli",
-             "containerd.io", "docker-buildx-plugin", "docker-compose-plugin"],
+            ["sudo", "sh", "-c",
+             "yum install -y yum-utils && "
+             "yum-config-manager --add-repo https://download.docker.com/linux/centos/docker-ce.repo && "
+             "yum install -y docker-ce docker-ce-cli containerd.io "
+             "docker-buildx-plugin docker-compose-plugin"],
             capture_output=True,
             text=True
         )
@@ -127,16 +235,9 @@ def _install_docker_rhel() -> tuple[bool, str]:
         if result.returncode != 0:
             return False, f"Installation failed: {result.stderr}"
 
-        # Start and enable Docker
-        subprocess.run(["sudo", "systemctl", "start", "docker"], capture_output=True)
-        subprocess.run(["sudo", "systemctl", "enable", "docker"], capture_output=True)
-
-        # Add current user to docker group
-        user = os.environ.get("USER", os.environ.get("USERNAME", "centos"))
-        subprocess.run(
-            ["sudo", "usermod", "-aG", "docker", user],
-            capture_output=True
-        )
+        # Start and enable Docker, and add current user to docker group
+        user = _invoking_user()
+        _enable_docker_service(user)
 
         return True, "Docker installed successfully. Please log out and log back in for group changes to take effect."
 
@@ -158,16 +259,9 @@ def _install_docker_fedora() -> tuple[bool, str]:
         if result.returncode != 0:
             return False, f"Installation failed: {result.stderr}"
 
-        # Start and enable Docker
-        subprocess.run(["sudo", "systemctl", "start", "docker"], capture_output=True)
-        subprocess.run(["sudo", "systemctl", "enable", "docker"], capture_output=True)
-
-        # Add current user to docker group
-        user = os.environ.get("USER", os.environ.get("USERNAME", "fedora"))
-        subprocess.run(
-            ["sudo", "usermod", "-aG", "docker", user],
-            capture_output=True
-        )
+        # Start and enable Docker, and add current user to docker group
+        user = _invoking_user()
+        _enable_docker_service(user)
 
         return True, "Docker installed successfully. Please log out and log back in for group changes to take effect."
 
@@ -175,6 +269,26 @@ def _install_docker_fedora() -> tuple[bool, str]:
         return False, f"Installation failed: {e}"
 
 
+def _invoking_user() -> str:
+    """Return the login of the user running the installer, even under sudo."""
+    user = os.environ.get("SUDO_USER")
+    if user:
+        return user
+
+    import pwd
+
+    return pwd.getpwuid(os.getuid()).pw_name
+
+
+def _enable_docker_service(user: str) -> None:
+    """Enable and start the Docker service and add user to the docker group in one sudo call."""
+    subprocess.run(
+        ["sudo", "sh", "-c",
+         f"systemctl enable --now docker; usermod -aG docker {shlex.quote(user)}"],
+        capture_output=True
+    )
+
+
 def ensure_docker(verbose: bool = True) -> tuple[bool, str]:
     """
     Ensure Docker is installed and running. Install if needed.
@@ -196,6 +310,7 @@ def ensure_docker(verbose: bool = True) -> tuple[bool, str]:
                     check=True,
                     capture_output=True
                 )
+                invalidate_docker_cache()
                 return True, "Docker started successfully."
             except Exception as e:
                 return False, f"Docker is installed but not running. Failed to start: {e}"
@@ -208,7 +323,6 @@ def ensure_docker(verbose: bool = True) -> tuple[bool, str]:
 
     if success and verbose:
         # Give Docker a moment to start
-        import time
         time.sleep(2)
 
     return success, message
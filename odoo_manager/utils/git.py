@@ -2,14 +2,28 @@
 Git utility functions for Odoo Manager.
 """
 
+import re
 import subprocess
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+
+# Matches the "ahead N" / "behind N" parts of %(upstream:track)
+_TRACK_RE = re.compile(r"(ahead|behind) (\d+)")
+
+# Local path, or a known scheme followed by a ".git" suffix or a repository path
+_GIT_URL_RE = re.compile(r"/|(?:https?://|git://|file://|git@).*?(?:\.git|/)")
+
+# Porcelain v2 XY code -> (staged, modified), built once for every code pair
+_XY_FLAGS = {x + y: (x in "MADRC", y == "M") for x in ".MTADRC" for y in ".MTADRC"}
 
 
 def run_git_command(
-    cwd: Path, *args: str, capture: bool = True, check: bool = True
-) -> Optional[str]:
+    cwd: Path,
+    *args: str,
+    capture: bool = True,
+    check: bool = True,
+    strip: bool = True,
+) -> str | None:
     """Run a git command in the specified directory.
 
     Args:
@@ -17,6 +31,7 @@ def run_git_command(
         *args: Git command arguments (e.g., 'status', 'branch', '-v').
         capture: Whether to capture output.
         check: Whether to raise on non-zero exit.
+        strip: Strip surrounding whitespace from the output.
 
     Returns:
         Command output if capture=True, None otherwise.
@@ -28,7 +43,9 @@ def run_git_command(
 
     kwargs = {"cwd": cwd, "text": True}
     if capture:
-        kwargs["capture_output"] = True
+        kwargs["stdout"] = subprocess.PIPE
+        # stderr is only ever read back into the CalledProcessError below
+        kwargs["stderr"] = subprocess.PIPE if check else subprocess.DEVNULL
 
     result = subprocess.run(cmd, **kwargs)
 
@@ -36,7 +53,7 @@ def run_git_command(
         raise subprocess.CalledProcessError(result.returncode, cmd, result.stderr)
 
     if capture:
-        return result.stdout.strip()
+        return result.stdout.strip() if strip else result.stdout
 
     return None
 
@@ -55,7 +72,8 @@ def get_git_diff(cwd: Path, staged: bool = False) -> str:
     if staged:
         args.append("--staged")
 
-    return run_git_command(cwd, *args) or ""
+    # Diffs are returned verbatim; the trailing newline is part of the patch
+    return run_git_command(cwd, *args, strip=False) or ""
 
 
 def get_git_status(cwd: Path) -> dict:
@@ -68,7 +86,7 @@ def get_git_status(cwd: Path) -> dict:
         Dictionary with status information.
     """
     try:
-        output = run_git_command(cwd, "status", "--porcelain") or ""
+        output = run_git_command(cwd, "status", "--porcelain=v2", "-z", strip=False) or ""
     except subprocess.CalledProcessError:
         output = ""
 
@@ -77,21 +95,32 @@ def get_git_status(cwd: Path) -> dict:
     untracked = []
     conflicted = []
 
-    for line in output.split("\n"):
-        if not line:
+    entries = iter(output.split("\0"))
+    for entry in entries:
+        kind = entry[:1]
+
+        if kind == "1":
+            # 1 XY sub mH mI mW hH hI path
+            fields = entry.split(" ", 8)
+        elif kind == "2":
+            # 2 XY sub mH mI mW hH hI Xscore path, then the original path
+            fields = entry.split(" ", 9)
+            next(entries, None)
+        elif kind == "u":
+            conflicted.append(entry.split(" ", 10)[-1])
+            continue
+        elif kind == "?":
+            untracked.append(entry[2:])
+            continue
+        else:
             continue
 
-        status = line[:2]
-        path = line[3:]
-
-        if status[0] in ("M", "A", "D", "R", "C"):
+        is_staged, is_modified = _XY_FLAGS.get(fields[1], (False, False))
+        path = fields[-1]
+        if is_staged:
             staged.append(path)
-        if status[1] == "M":
+        if is_modified:
             modified.append(path)
-        if status == "??":
-            untracked.append(path)
-        if status in ("DD", "AU", "UD", "UA", "DU", "AA", "UU"):
-            conflicted.append(path)
 
     return {
         "staged": staged,
@@ -102,7 +131,7 @@ def get_git_status(cwd: Path) -> dict:
     }
 
 
-def get_changed_files(cwd: Path, branch: Optional[str] = None) -> list[str]:
+def get_changed_files(cwd: Path, branch: str | None = None) -> list[str]:
     """Get list of changed files compared to a branch.
 
     Args:
@@ -113,22 +142,38 @@ def get_changed_files(cwd: Path, branch: Optional[str] = None) -> list[str]:
         List of changed file paths.
     """
     if branch is None:
-        # Detect default branch
-        try:
-            if run_git_command(cwd, "rev-parse", "--verify", "main") is not None:
-                branch = "main"
-            else:
-                branch = "master"
-        except subprocess.CalledProcessError:
-            branch = "HEAD~10"  # Fallback to last 10 commits
+        branch = _default_branch(cwd)
 
     try:
         output = run_git_command(cwd, "diff", "--name-only", f"HEAD...{branch}")
-        return [f for f in output.split("\n") if f] if output else []
+        return output.splitlines() if output else []
     except subprocess.CalledProcessError:
         return []
 
 
+@lru_cache(maxsize=128)
+def _default_branch(cwd: Path) -> str:
+    """Detect the default branch, preferring the remote's HEAD."""
+    try:
+        head = run_git_command(cwd, "symbolic-ref", "--short", "refs/remotes/origin/HEAD")
+        if head:
+            return head.removeprefix("origin/")
+    except subprocess.CalledProcessError:
+        pass
+
+    try:
+        output = run_git_command(
+            cwd, "for-each-ref", "--format=%(refname:short)", "refs/heads/main", "refs/heads/master"
+        )
+    except subprocess.CalledProcessError:
+        output = None
+
+    if output:
+        return output.split("\n", 1)[0]
+
+    return "HEAD~10"  # Fallback to last 10 commits
+
+
 def format_commit_message(message: str, max_length: int = 80) -> str:
     """Format a commit message for display.
 
@@ -139,8 +184,8 @@ def format_commit_message(message: str, max_length: int = 80) -> str:
     Returns:
         Formatted commit message.
     """
-    # Get first line only
-    first_line = message.split("\n")[0].strip()
+    # Get first line only, without splitting the whole message
+    first_line = message.partition("\n")[0].strip()
 
     if len(first_line) > max_length:
         return first_line[: max_length - 3] + "..."
@@ -157,33 +202,10 @@ def validate_git_url(url: str) -> bool:
     Returns:
         True if URL appears to be valid.
     """
-    if not url:
-        return False
-
-    # Common git URL patterns
-    patterns = [
-        ("https://", False),
-        ("http://", False),
-        ("git@", False),
-        ("git://", False),
-        ("file://", False),
-        ("/", True),  # Local path
-    ]
-
-    for pattern, is_exact in patterns:
-        if is_exact:
-            if url.startswith(pattern):
-                return True
-        else:
-            if url.startswith(pattern):
-                # Check for common git repo patterns
-                if ".git" in url or "/" in url.split("://")[-1]:
-                    return True
+    return bool(url) and _GIT_URL_RE.match(url) is not None
 
-    return False
 
-
-def find_git_root(cwd: Path) -> Optional[Path]:
+def find_git_root(cwd: Path) -> Path | None:
     """Find the root of the git repository containing the given path.
 
     Args:
@@ -192,6 +214,14 @@ def find_git_root(cwd: Path) -> Optional[Path]:
     Returns:
         Path to git root, or None if not in a git repo.
     """
+    try:
+        toplevel = run_git_command(cwd, "rev-parse", "--show-toplevel", check=False)
+    except FileNotFoundError:
+        # git is not installed (or cwd is gone); look for a .git entry ourselves
+        pass
+    else:
+        return Path(toplevel) if toplevel else None
+
     current = cwd.resolve()
 
     while current != current.parent:
@@ -202,7 +232,7 @@ def find_git_root(cwd: Path) -> Optional[Path]:
     return None
 
 
-def get_git_remote_url(cwd: Path, remote: str = "origin") -> Optional[str]:
+def get_git_remote_url(cwd: Path, remote: str = "origin") -> str | None:
     """Get the URL of a git remote.
 
     Args:
@@ -227,28 +257,37 @@ def get_git_branch_info(cwd: Path) -> dict:
     Returns:
         Dictionary with branch information.
     """
-    try:
-        current = run_git_command(cwd, "branch", "--show-current")
-    except subprocess.CalledProcessError:
-        current = None
+    current = tracking = None
+    ahead = behind = 0
 
     try:
-        # Get tracking branch
-        tracking = run_git_command(cwd, "rev-parse", "--abbrev-ref", "--symbolic-full-name", "@{u}")
-    except subprocess.CalledProcessError:
-        tracking = None
+        ref = run_git_command(cwd, "symbolic-ref", "-q", "HEAD")
+    except subprocess.CalledProcessError as e:
+        # Exit status 1 means a detached HEAD; anything else is not a repository
+        ref = "" if e.returncode == 1 else None
 
-    try:
-        ahead = run_git_command(cwd, "rev-list", "--count", "@{u}..HEAD")
-        ahead = int(ahead) if ahead else 0
-    except subprocess.CalledProcessError:
-        ahead = 0
+    if ref is not None:
+        current = ref.removeprefix("refs/heads/")
 
-    try:
-        behind = run_git_command(cwd, "rev-list", "--count", "HEAD..@{u}")
-        behind = int(behind) if behind else 0
-    except subprocess.CalledProcessError:
-        behind = 0
+    if current:
+        try:
+            # One for-each-ref on HEAD's own ref yields upstream and ahead/behind together
+            output = run_git_command(
+                cwd,
+                "for-each-ref",
+                "--format=%(upstream:short)%09%(upstream:track,nobracket)",
+                ref,
+            )
+        except subprocess.CalledProcessError:
+            output = ""
+
+        upstream, _, track = (output or "").partition("\t")
+        tracking = upstream or None
+        for key, count in _TRACK_RE.findall(track):
+            if key == "ahead":
+                ahead = int(count)
+            else:
+                behind = int(count)
 
     return {
         "current": current,
@@ -2,8 +2,11 @@
 Notification utilities for Odoo Manager.
 """
 
+import atexit
 import logging
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any, Optional
 from urllib.parse import urlparse
@@ -12,6 +15,23 @@ import httpx
 
 from odoo_manager.utils.output import info, warn, error
 
+# Shared HTTP client so repeated webhook/Slack sends reuse pooled connections
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+
+
+def _get_http_client() -> httpx.Client:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None:
+        # Senders run on the manager's thread pool; only one of them may build the client
+        with _http_client_lock:
+            if _http_client is None:
+                client = httpx.Client(limits=httpx.Limits(max_keepalive_connections=8))
+                atexit.register(client.close)
+                _http_client = client
+    return _http_client
+
 
 @dataclass
 class NotificationMessage:
@@ -63,7 +83,7 @@ class WebhookNotificationSender(NotificationSender):
             if notification.details:
                 payload["details"] = notification.details
 
-            response = httpx.post(self.url, json=payload, timeout=self.timeout)
+            response = _get_http_client().post(self.url, json=payload, timeout=self.timeout)
             response.raise_for_status()
 
             return True
@@ -109,7 +129,9 @@ class SlackNotificationSender(NotificationSender):
                 ]
             }
 
-            response = httpx.post(self.webhook_url, json=payload, timeout=self.timeout)
+            response = _get_http_client().post(
+                self.webhook_url, json=payload, timeout=self.timeout
+            )
             response.raise_for_status()
 
             return True
@@ -149,6 +171,32 @@ class EmailNotificationSender(NotificationSender):
         self.password = password
         self.from_address = from_address
         self.to_addresses = to_addresses
+        self._server = None
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _connect(self):
+        """Open an authenticated SMTP session."""
+        import smtplib
+
+        server = smtplib.SMTP(self.smtp_host, self.smtp_port)
+        try:
+            server.starttls()
+            server.login(self.username, self.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def close(self) -> None:
+        """Close the cached SMTP session, if any."""
+        with self._lock:
+            server, self._server = self._server, None
+        if server is not None:
+            try:
+                server.quit()
+            except Exception:
+                server.close()
 
     def send(self, notification: NotificationMessage) -> bool:
         """Send notification via email."""
@@ -169,10 +217,15 @@ class EmailNotificationSender(NotificationSender):
 
             msg.set_content(body)
 
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
+            # Keep the session open between sends; reconnect once if the server dropped it
+            with self._lock:
+                if self._server is None:
+                    self._server = self._connect()
+                try:
+                    self._server.send_message(msg)
+                except smtplib.SMTPServerDisconnected:
+                    self._server = self._connect()
+                    self._server.send_message(msg)
 
             return True
 
@@ -189,8 +242,18 @@ class NotificationManager:
     def __init__(self):
         """Initialize notification manager."""
         self.senders: list[NotificationSender] = []
+        self._pool: Optional[ThreadPoolExecutor] = None
         self._load_senders()
 
+    @property
+    def pool(self) -> ThreadPoolExecutor:
+        """Lazily created pool that fans a notification out to every sender."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=len(self.senders), thread_name_prefix="notify"
+            )
+        return self._pool
+
     def _load_senders(self) -> None:
         """Load notification senders from environment variables."""
         # Webhook URL
@@ -238,12 +301,13 @@ class NotificationManager:
             )
             return 0
 
-        success_count = 0
-        for sender in self.senders:
-            if sender.send(notification):
-                success_count += 1
+        if len(self.senders) == 1:
+            return int(self.senders[0].send(notification))
 
-        return success_count
+        # Senders block on network I/O; run them side by side so the slowest
+        # one (usually SMTP) bounds the total instead of the sum of all
+        results = self.pool.map(lambda sender: sender.send(notification), self.senders)
+        return sum(1 for sent in results if sent)
 
     def info(self, title: str, message: str, details: Optional[dict] = None) -> int:
         """Send info notification."""
@@ -8,7 +8,6 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.table import Table
-from rich.text import Text
 
 console = Console()
 
@@ -56,8 +55,8 @@ def print_panel(content: str, title: str = "", style: str = "") -> None:
 
 def print_json(data: dict[str, Any]) -> None:
     """Print data as JSON."""
-    import json
-    console.print_json(json.dumps(data, indent=2, default=str))
+    # Hand Rich the object itself; passing a JSON string makes it parse and re-dump
+    console.print_json(data=data, indent=2, default=str)
 
 
 class Spinner:
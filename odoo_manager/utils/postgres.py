@@ -2,13 +2,116 @@
 PostgreSQL utility functions.
 """
 
-from typing import Any, Optional
+import atexit
+import hashlib
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
 
 import psycopg2
+from psycopg2 import sql as pgsql
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from psycopg2.pool import ThreadedConnectionPool
 
 from odoo_manager.exceptions import PostgresConnectionError
 
+# (host, port, user, database, password digest) -> pool, shared by all helpers below
+_pools: dict[tuple, ThreadedConnectionPool] = {}
+_pools_lock = threading.Lock()
+_POOL_MAX = 8
+# Seconds to wait for the server before giving up on a new connection
+_CONNECT_TIMEOUT = 5
+
+_TERMINATE_BACKENDS = "SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = %s"
+
+
+def _get_pool(
+    host: str, port: int, user: str, password: str, database: str
+) -> ThreadedConnectionPool:
+    """Get the connection pool for a server/database, creating it on first use."""
+    # Key on a digest so a changed password gets its own pool without the
+    # plaintext sitting in a module-level dict
+    digest = hashlib.sha256(password.encode()).hexdigest()
+    key = (host, port, user, database, digest)
+    with _pools_lock:
+        pool = _pools.get(key)
+    if pool is not None:
+        return pool
+
+    # Connect outside the lock so a slow or unreachable server doesn't block other pools
+    new_pool = ThreadedConnectionPool(
+        1,
+        _POOL_MAX,
+        host=host,
+        port=port,
+        user=user,
+        password=password,
+        database=database,
+        connect_timeout=_CONNECT_TIMEOUT,
+    )
+    with _pools_lock:
+        pool = _pools.setdefault(key, new_pool)
+    if pool is not new_pool:
+        # Another thread got there first; keep its pool
+        new_pool.closeall()
+    return pool
+
+
+def _checkout(pool: ThreadedConnectionPool):
+    """Get a live autocommit connection from the pool.
+
+    Idle connections die when the server restarts, so each one is checked with
+    a cheap SELECT 1 and dead ones are discarded until a working (or freshly
+    opened) connection turns up.
+    """
+    for _ in range(_POOL_MAX):
+        conn = pool.getconn()
+        try:
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            return conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            pool.putconn(conn, close=True)
+
+    # Every idle connection was dead; the pool now opens a new one
+    conn = pool.getconn()
+    conn.autocommit = True
+    return conn
+
+
+def _close_pools() -> None:
+    """Close every pooled connection (registered with atexit)."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.closeall()
+        _pools.clear()
+
+
+atexit.register(_close_pools)
+
+
+@contextmanager
+def pg_conn(
+    host: str = "localhost",
+    port: int = 5432,
+    user: str = "postgres",
+    password: str = "",
+    database: str = "postgres",
+) -> Iterator[Any]:
+    """Borrow an autocommit connection from the pool for the duration of the block."""
+    try:
+        pool = _get_pool(host, port, user, password, database)
+        conn = _checkout(pool)
+    except psycopg2.Error as e:
+        raise PostgresConnectionError(f"Failed to connect to PostgreSQL: {e}")
+
+    try:
+        yield conn
+    finally:
+        # Connections that died mid-use are discarded rather than handed out again
+        pool.putconn(conn, close=bool(conn.closed))
+
 
 def get_postgres_connection(
     host: str = "localhost",
@@ -40,33 +143,27 @@ def list_databases(
     exclude_template: bool = True,
 ) -> list[dict[str, Any]]:
     """List all databases."""
-    conn = get_postgres_connection(host, port, user, password)
-    cursor = conn.cursor()
-
-    try:
+    with pg_conn(host, port, user, password) as conn, conn.cursor() as cursor:
+        # Filter server-side so template databases are never sized or transferred
         cursor.execute(
             "SELECT datname, pg_size_pretty(pg_database_size(datname)) as size, "
             "pg_encoding_to_char(encoding) as encoding "
             "FROM pg_database "
-            "ORDER BY datname"
+            "WHERE NOT %s OR datname NOT LIKE 'template%%' "
+            "ORDER BY datname",
+            (exclude_template,),
         )
-        results = cursor.fetchall()
-
-        databases = []
-        for row in results:
-            name, size, encoding = row
-            if exclude_template and name.startswith("template"):
-                continue
-            databases.append({
-                "name": name,
-                "size": size,
-                "encoding": encoding,
-            })
-
-        return databases
-    finally:
-        cursor.close()
-        conn.close()
+
+        return [
+            {"name": name, "size": size, "encoding": encoding}
+            for name, size, encoding in cursor.fetchall()
+        ]
+
+
+def _existing(cursor, *names: str) -> set[str]:
+    """Return which of the given database names exist, in one query."""
+    cursor.execute("SELECT datname FROM pg_database WHERE datname = ANY(%s)", (list(names),))
+    return {row[0] for row in cursor.fetchall()}
 
 
 def database_exists(
@@ -77,15 +174,8 @@ def database_exists(
     password: str = "",
 ) -> bool:
     """Check if a database exists."""
-    conn = get_postgres_connection(host, port, user, password)
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute("SELECT 1 FROM pg_database WHERE datname = %s", (name,))
-        return cursor.fetchone() is not None
-    finally:
-        cursor.close()
-        conn.close()
+    with pg_conn(host, port, user, password) as conn, conn.cursor() as cursor:
+        return bool(_existing(cursor, name))
 
 
 def create_database(
@@ -98,19 +188,16 @@ def create_database(
     encoding: str = "UTF8",
 ) -> None:
     """Create a new database."""
-    if database_exists(name, host, port, user, password):
-        raise ValueError(f"Database '{name}' already exists")
-
-    conn = get_postgres_connection(host, port, user, password)
-    cursor = conn.cursor()
+    with pg_conn(host, port, user, password) as conn, conn.cursor() as cursor:
+        if _existing(cursor, name):
+            raise ValueError(f"Database '{name}' already exists")
 
-    try:
         cursor.execute(
-            f'CREATE DATABASE "{name}" TEMPLATE = "{template}" ENCODING = \'{encoding}\''
+            pgsql.SQL("CREATE DATABASE {} TEMPLATE = {} ENCODING = %s").format(
+                pgsql.Identifier(name), pgsql.Identifier(template)
+            ),
+            (encoding,),
         )
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def drop_database(
@@ -121,21 +208,13 @@ def drop_database(
     password: str = "",
 ) -> None:
     """Drop a database."""
-    if not database_exists(name, host, port, user, password):
-        raise ValueError(f"Database '{name}' does not exist")
+    with pg_conn(host, port, user, password) as conn, conn.cursor() as cursor:
+        if not _existing(cursor, name):
+            raise ValueError(f"Database '{name}' does not exist")
 
-    # Terminate connections first
-    conn = get_postgres_connection(host, port, user, password)
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute(
-            f"SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = '{name}'"
-        )
-        cursor.execute(f'DROP DATABASE "{name}"')
-    finally:
-        cursor.close()
-        conn.close()
+        # Terminate connections first (DROP DATABASE must be its own statement)
+        cursor.execute(_TERMINATE_BACKENDS, (name,))
+        cursor.execute(pgsql.SQL("DROP DATABASE {}").format(pgsql.Identifier(name)))
 
 
 def duplicate_database(
@@ -147,20 +226,19 @@ def duplicate_database(
     password: str = "",
 ) -> None:
     """Duplicate a database."""
-    if not database_exists(source, host, port, user, password):
-        raise ValueError(f"Source database '{source}' does not exist")
+    with pg_conn(host, port, user, password) as conn, conn.cursor() as cursor:
+        existing = _existing(cursor, source, target)
+        if source not in existing:
+            raise ValueError(f"Source database '{source}' does not exist")
 
-    if database_exists(target, host, port, user, password):
-        raise ValueError(f"Target database '{target}' already exists")
+        if target in existing:
+            raise ValueError(f"Target database '{target}' already exists")
 
-    conn = get_postgres_connection(host, port, user, password)
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute(f'CREATE DATABASE "{target}" TEMPLATE = "{source}"')
-    finally:
-        cursor.close()
-        conn.close()
+        cursor.execute(
+            pgsql.SQL("CREATE DATABASE {} TEMPLATE = {}").format(
+                pgsql.Identifier(target), pgsql.Identifier(source)
+            )
+        )
 
 
 def get_database_size(
@@ -171,19 +249,14 @@ def get_database_size(
     password: str = "",
 ) -> Optional[str]:
     """Get the size of a database."""
-    if not database_exists(name, host, port, user, password):
-        return None
-
-    conn = get_postgres_connection(host, port, user, password, database=name)
-    cursor = conn.cursor()
-
-    try:
-        cursor.execute("SELECT pg_size_pretty(pg_database_size(%s))", (name,))
+    with pg_conn(host, port, user, password) as conn, conn.cursor() as cursor:
+        # Filtering on pg_database yields no row (rather than an error) for unknown names
+        cursor.execute(
+            "SELECT pg_size_pretty(pg_database_size(datname)) FROM pg_database WHERE datname = %s",
+            (name,),
+        )
         result = cursor.fetchone()
         return result[0] if result else None
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def rename_database(
@@ -195,24 +268,21 @@ def rename_database(
     password: str = "",
 ) -> None:
     """Rename a database."""
-    if not database_exists(old_name, host, port, user, password):
-        raise ValueError(f"Database '{old_name}' does not exist")
+    with pg_conn(host, port, user, password) as conn, conn.cursor() as cursor:
+        existing = _existing(cursor, old_name, new_name)
+        if old_name not in existing:
+            raise ValueError(f"Database '{old_name}' does not exist")
 
-    if database_exists(new_name, host, port, user, password):
-        raise ValueError(f"Database '{new_name}' already exists")
+        if new_name in existing:
+            raise ValueError(f"Database '{new_name}' already exists")
 
-    # Terminate connections first
-    conn = get_postgres_connection(host, port, user, password)
-    cursor = conn.cursor()
-
-    try:
+        # Terminate connections first
+        cursor.execute(_TERMINATE_BACKENDS, (old_name,))
         cursor.execute(
-            f"SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname = '{old_name}'"
+            pgsql.SQL("ALTER DATABASE {} RENAME TO {}").format(
+                pgsql.Identifier(old_name), pgsql.Identifier(new_name)
+            )
         )
-        cursor.execute(f'ALTER DATABASE "{old_name}" RENAME TO "{new_name}"')
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def execute_sql(
@@ -225,18 +295,12 @@ def execute_sql(
     fetch: bool = False,
 ) -> Optional[list[tuple]]:
     """Execute arbitrary SQL."""
-    conn = get_postgres_connection(host, port, user, password, database)
-    cursor = conn.cursor()
-
-    try:
+    with pg_conn(host, port, user, password, database) as conn, conn.cursor() as cursor:
         cursor.execute(sql)
         if fetch:
             return cursor.fetchall()
         conn.commit()
         return None
-    finally:
-        cursor.close()
-        conn.close()
 
 
 def check_connection(
@@ -257,8 +321,9 @@ def check_connection(
         True if connection successful.
     """
     try:
-        conn = get_postgres_connection(host, port, user, password)
-        conn.close()
+        # Checkout already makes a SELECT 1 round-trip on the pooled connection
+        with pg_conn(host, port, user, password):
+            pass
         return True
     except Exception:
         return False